@@ -7,16 +7,58 @@ Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
 
 import streamlit as st
 import pandas as pd
+import os
 import sys
 from pathlib import Path
 
-# Agregar path para imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Agregar path para imports (una sola vez: el script se re-ejecuta en cada rerun)
+_p = str(Path(__file__).parent.parent)
+if _p not in sys.path:
+    sys.path.insert(0, _p)
 from utils.auth import AuthSystem
 from utils.navegacion import mostrar_sidebar_navegacion
 
-# Inicializar sistema de autenticación
-auth = AuthSystem()
+# Inicializar sistema de autenticación (una sola instancia por proceso)
+@st.cache_resource
+def _get_auth() -> AuthSystem:
+    """Devuelve la instancia compartida de AuthSystem"""
+    return AuthSystem()
+
+auth = _get_auth()
+
+@st.cache_data(ttl=30)
+def _get_users() -> list:
+    """Lista de usuarios (se invalida al crear, modificar o eliminar)"""
+    return auth.listar_usuarios()
+
+@st.cache_data(ttl=30)
+def _get_usernames() -> tuple:
+    """Nombres de usuario para los selectores"""
+    return tuple(u['username'] for u in _get_users())
+
+@st.cache_data
+def _build_users_df(usuarios: list) -> pd.DataFrame:
+    """Arma la tabla de usuarios para mostrar (se recalcula solo si cambia la lista)"""
+    df_usuarios = pd.DataFrame(usuarios)
+    df_display = df_usuarios[['username', 'nivel', 'nombre_completo', 'cargo', 'email', 'ultimo_acceso', 'activo']].copy()
+    df_display.columns = ['Usuario', 'Nivel', 'Nombre', 'Cargo', 'Email', 'Último Acceso', 'Activo']
+    df_display['Activo'] = df_display['Activo'].map({1: '✅', 0: '❌'})
+    return df_display
+
+@st.cache_data(ttl=None)
+def _load_csv(path: str, mtime: float, columnas_fecha: tuple = ()) -> pd.DataFrame:
+    """Carga un dataset CSV (mtime invalida la caché cuando el archivo cambia)"""
+    df = pd.read_csv(path, encoding='utf-8')
+    # Las columnas de fecha se parsean una sola vez, al cargar
+    for columna in columnas_fecha:
+        if columna in df.columns:
+            df[columna] = pd.to_datetime(df[columna], dayfirst=True, format='mixed')
+    return df
+
+@st.cache_data
+def _encode_csv(df: pd.DataFrame) -> bytes:
+    """CSV para descarga (se serializa una vez por versión del DataFrame)"""
+    return df.to_csv(index=False).encode('utf-8')
 
 # Sidebar de navegación
 mostrar_sidebar_navegacion('admin')
@@ -42,436 +84,310 @@ else:  # admin
     tab3 = None
 
 # TAB 1: GESTIÓN DE USUARIOS
-with tab1:
-    st.markdown("## 👥 Gestión de Usuarios")
+# Cada subtab es un fragmento: sus interacciones no re-ejecutan el resto de la página
+@st.fragment
+def _crear_usuario():
+    """Formulario de alta de usuarios"""
+    st.markdown("### ➕ Crear Nuevo Usuario")
     
-    subtab1, subtab2, subtab3 = st.tabs(["Crear Usuario", "Ver Usuarios", "Modificar"])
-    
-    with subtab1:
-        st.markdown("### ➕ Crear Nuevo Usuario")
-        
-        with st.form("form_crear_usuario"):
-            col1, col2 = st.columns(2)
+    with st.form("form_crear_usuario"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            nuevo_username = st.text_input("Nombre de usuario*", max_chars=50)
+            nuevo_nombre = st.text_input("Nombre completo", max_chars=100)
+            nuevo_cargo = st.text_input("Cargo en el Tribunal", max_chars=100, 
+                                        placeholder="Ej: Juez, Secretario, Prosecretario, Empleado...")
+        
+        with col2:
+            nuevo_password = st.text_input("Contraseña*", type="password", max_chars=50)
+            nuevo_email = st.text_input("Email", max_chars=100)
             
-            with col1:
-                nuevo_username = st.text_input("Nombre de usuario*", max_chars=50)
-                nuevo_nombre = st.text_input("Nombre completo", max_chars=100)
-                nuevo_cargo = st.text_input("Cargo en el Tribunal", max_chars=100, 
-                                            placeholder="Ej: Juez, Secretario, Prosecretario, Empleado...")
+            # Niveles según quien crea
+            if es_superadmin:
+                opciones_nivel = ["usuario", "admin", "superadmin"]
+                ayuda_nivel = "superadmin: acceso total | admin: gestiona usuarios | usuario: solo usa apps"
+            else:  # admin
+                opciones_nivel = ["usuario", "admin"]
+                ayuda_nivel = "admin: gestiona usuarios | usuario: solo usa apps"
             
-            with col2:
-                nuevo_password = st.text_input("Contraseña*", type="password", max_chars=50)
-                nuevo_email = st.text_input("Email", max_chars=100)
-                
-                # Niveles según quien crea
-                if es_superadmin:
-                    opciones_nivel = ["usuario", "admin", "superadmin"]
-                    ayuda_nivel = "superadmin: acceso total | admin: gestiona usuarios | usuario: solo usa apps"
-                else:  # admin
-                    opciones_nivel = ["usuario", "admin"]
-                    ayuda_nivel = "admin: gestiona usuarios | usuario: solo usa apps"
+            nuevo_nivel = st.selectbox("Nivel de acceso*", opciones_nivel, help=ayuda_nivel)
+        
+        submitted = st.form_submit_button("Crear Usuario", use_container_width=True, type="primary")
+        
+        if submitted:
+            if not nuevo_username or not nuevo_password:
+                st.error("Usuario y contraseña son obligatorios")
+            else:
+                exito, mensaje = auth.crear_usuario(
+                    username=nuevo_username,
+                    password=nuevo_password,
+                    nivel=nuevo_nivel,
+                    nombre_completo=nuevo_nombre,
+                    cargo=nuevo_cargo,
+                    email=nuevo_email,
+                    creado_por=st.session_state.usuario['username']
+                )
                 
-                nuevo_nivel = st.selectbox("Nivel de acceso*", opciones_nivel, help=ayuda_nivel)
-            
-            submitted = st.form_submit_button("Crear Usuario", use_container_width=True, type="primary")
-            
-            if submitted:
-                if not nuevo_username or not nuevo_password:
-                    st.error("Usuario y contraseña son obligatorios")
+                if exito:
+                    _get_users.clear()
+                    _get_usernames.clear()
+                    st.success(mensaje)
+                    st.rerun()
                 else:
-                    exito, mensaje = auth.crear_usuario(
-                        username=nuevo_username,
-                        password=nuevo_password,
-                        nivel=nuevo_nivel,
-                        nombre_completo=nuevo_nombre,
-                        cargo=nuevo_cargo,
-                        email=nuevo_email,
-                        creado_por=st.session_state.usuario['username']
-                    )
-                    
-                    if exito:
-                        st.success(mensaje)
-                        st.rerun()
-                    else:
-                        st.error(mensaje)
+                    st.error(mensaje)
+
+@st.fragment
+def _ver_usuarios(usuarios: list):
+    """Listado de usuarios del sistema"""
+    st.markdown("### 📋 Usuarios del Sistema")
     
-    with subtab2:
-        st.markdown("### 📋 Usuarios del Sistema")
+    if usuarios:
+        df_display = _build_users_df(usuarios)
         
-        usuarios = auth.listar_usuarios()
-        
-        if usuarios:
-            df_usuarios = pd.DataFrame(usuarios)
-            df_display = df_usuarios[['username', 'nivel', 'nombre_completo', 'cargo', 'email', 'ultimo_acceso', 'activo']].copy()
-            df_display.columns = ['Usuario', 'Nivel', 'Nombre', 'Cargo', 'Email', 'Último Acceso', 'Activo']
-            df_display['Activo'] = df_display['Activo'].map({1: '✅', 0: '❌'})
-            
-            st.dataframe(df_display, use_container_width=True, hide_index=True)
-            st.caption(f"Total de usuarios: {len(usuarios)}")
-        else:
-            st.info("No hay usuarios en el sistema")
+        st.dataframe(df_display, use_container_width=True, hide_index=True)
+        st.caption(f"Total de usuarios: {len(usuarios)}")
+    else:
+        st.info("No hay usuarios en el sistema")
+
+@st.fragment
+def _modificar_usuario():
+    """Edición, cambio de contraseña y baja de usuarios"""
+    st.markdown("### ✏️ Modificar Usuario")
     
-    with subtab3:
-        st.markdown("### ✏️ Modificar Usuario")
+    usuario_sel = st.selectbox("Seleccionar usuario", _get_usernames())
+    usuario_data = auth.obtener_usuario(usuario_sel)
+    
+    if usuario_data:
+        # Mostrar datos actuales
+        st.info(f"**Nivel actual:** {usuario_data['nivel']} | **Cargo:** {usuario_data.get('cargo', 'N/A')}")
+        
+        # Editar datos básicos
+        st.markdown("#### ✏️ Editar Datos")
+        with st.form("form_editar_datos"):
+            col_a, col_b = st.columns(2)
+            with col_a:
+                nuevo_nombre = st.text_input("Nombre completo", value=usuario_data.get('nombre_completo', ''))
+                nuevo_cargo = st.text_input("Cargo", value=usuario_data.get('cargo', ''))
+            with col_b:
+                nuevo_email = st.text_input("Email", value=usuario_data.get('email', ''))
+                if es_superadmin:
+                    nuevo_nivel = st.selectbox("Nivel", ["usuario", "admin", "superadmin"], 
+                                               index=["usuario", "admin", "superadmin"].index(usuario_data['nivel']))
+                else:
+                    st.text_input("Nivel (no modificable)", value=usuario_data['nivel'], disabled=True)
+                    nuevo_nivel = usuario_data['nivel']
+            
+            if st.form_submit_button("💾 Guardar Cambios", use_container_width=True):
+                exito, mensaje = auth.modificar_usuario(
+                    username=usuario_sel,
+                    modificado_por=st.session_state.usuario['username'],
+                    nombre_completo=nuevo_nombre,
+                    cargo=nuevo_cargo,
+                    email=nuevo_email,
+                    nivel=nuevo_nivel if es_superadmin else None
+                )
+                if exito:
+                    _get_users.clear()
+                    _get_usernames.clear()
+                    st.success(mensaje)
+                    st.rerun()
+                else:
+                    st.error(mensaje)
         
-        usuarios = auth.listar_usuarios()
-        usernames = [u['username'] for u in usuarios]
+        st.markdown("---")
         
-        usuario_sel = st.selectbox("Seleccionar usuario", usernames)
-        usuario_data = auth.obtener_usuario(usuario_sel)
+        col1, col2 = st.columns(2)
         
-        if usuario_data:
-            # Mostrar datos actuales
-            st.info(f"**Nivel actual:** {usuario_data['nivel']} | **Cargo:** {usuario_data.get('cargo', 'N/A')}")
-            
-            # Editar datos básicos
-            st.markdown("#### ✏️ Editar Datos")
-            with st.form("form_editar_datos"):
-                col_a, col_b = st.columns(2)
-                with col_a:
-                    nuevo_nombre = st.text_input("Nombre completo", value=usuario_data.get('nombre_completo', ''))
-                    nuevo_cargo = st.text_input("Cargo", value=usuario_data.get('cargo', ''))
-                with col_b:
-                    nuevo_email = st.text_input("Email", value=usuario_data.get('email', ''))
-                    if es_superadmin:
-                        nuevo_nivel = st.selectbox("Nivel", ["usuario", "admin", "superadmin"], 
-                                                   index=["usuario", "admin", "superadmin"].index(usuario_data['nivel']))
-                    else:
-                        st.text_input("Nivel (no modificable)", value=usuario_data['nivel'], disabled=True)
-                        nuevo_nivel = usuario_data['nivel']
+        # Solo superadmin puede cambiar contraseñas
+        with col1:
+            st.markdown("#### 🔑 Cambiar Contraseña")
+            if es_superadmin:
+                with st.form("form_cambiar_pass"):
+                    nueva_pass = st.text_input("Nueva contraseña", type="password")
+                    confirmar_pass = st.text_input("Confirmar contraseña", type="password")
+                    
+                    if st.form_submit_button("Cambiar Contraseña"):
+                        if nueva_pass != confirmar_pass:
+                            st.error("Las contraseñas no coinciden")
+                        elif nueva_pass:
+                            exito, mensaje = auth.cambiar_password(
+                                username=usuario_sel,
+                                nueva_password=nueva_pass,
+                                cambiado_por=st.session_state.usuario['username']
+                            )
+                            if exito:
+                                _get_users.clear()
+                                st.success(mensaje)
+                            else:
+                                st.error(mensaje)
+            else:
+                st.warning("⚠️ Solo el Administrador General puede cambiar contraseñas")
+        
+        # Superadmin y admin pueden eliminar usuarios
+        with col2:
+            st.markdown("#### 🗑️ Eliminar Usuario")
+            if es_superadmin or es_admin:
+                st.warning(f"¿Eliminar usuario **{usuario_sel}**?")
                 
-                if st.form_submit_button("💾 Guardar Cambios", use_container_width=True):
-                    exito, mensaje = auth.modificar_usuario(
+                if st.button("🗑️ Eliminar", type="secondary", use_container_width=True):
+                    exito, mensaje = auth.eliminar_usuario(
                         username=usuario_sel,
-                        modificado_por=st.session_state.usuario['username'],
-                        nombre_completo=nuevo_nombre,
-                        cargo=nuevo_cargo,
-                        email=nuevo_email,
-                        nivel=nuevo_nivel if es_superadmin else None
+                        eliminado_por=st.session_state.usuario['username']
                     )
                     if exito:
+                        _get_users.clear()
+                        _get_usernames.clear()
                         st.success(mensaje)
                         st.rerun()
                     else:
                         st.error(mensaje)
-            
-            st.markdown("---")
-            
-            col1, col2 = st.columns(2)
-            
-            # Solo superadmin puede cambiar contraseñas
-            with col1:
-                st.markdown("#### 🔑 Cambiar Contraseña")
-                if es_superadmin:
-                    with st.form("form_cambiar_pass"):
-                        nueva_pass = st.text_input("Nueva contraseña", type="password")
-                        confirmar_pass = st.text_input("Confirmar contraseña", type="password")
-                        
-                        if st.form_submit_button("Cambiar Contraseña"):
-                            if nueva_pass != confirmar_pass:
-                                st.error("Las contraseñas no coinciden")
-                            elif nueva_pass:
-                                exito, mensaje = auth.cambiar_password(
-                                    username=usuario_sel,
-                                    nueva_password=nueva_pass,
-                                    cambiado_por=st.session_state.usuario['username']
-                                )
-                                if exito:
-                                    st.success(mensaje)
-                                else:
-                                    st.error(mensaje)
-                else:
-                    st.warning("⚠️ Solo el Administrador General puede cambiar contraseñas")
-            
-            # Superadmin y admin pueden eliminar usuarios
-            with col2:
-                st.markdown("#### 🗑️ Eliminar Usuario")
-                if es_superadmin or es_admin:
-                    st.warning(f"¿Eliminar usuario **{usuario_sel}**?")
-                    
-                    if st.button("🗑️ Eliminar", type="secondary", use_container_width=True):
-                        exito, mensaje = auth.eliminar_usuario(
-                            username=usuario_sel,
-                            eliminado_por=st.session_state.usuario['username']
-                        )
-                        if exito:
-                            st.success(mensaje)
-                            st.rerun()
-                        else:
-                            st.error(mensaje)
-                else:
-                    st.warning("⚠️ Solo administradores pueden eliminar usuarios")
+            else:
+                st.warning("⚠️ Solo administradores pueden eliminar usuarios")
+
+with tab1:
+    st.markdown("## 👥 Gestión de Usuarios")
+    
+    # Lista de usuarios: una sola consulta por ejecución para todo el tab
+    usuarios = _get_users()
+    
+    subtab1, subtab2, subtab3 = st.tabs(["Crear Usuario", "Ver Usuarios", "Modificar"])
+    
+    with subtab1:
+        _crear_usuario()
+    
+    with subtab2:
+        _ver_usuarios(usuarios)
+    
+    with subtab3:
+        _modificar_usuario()
 
 # TAB 2: EDICIÓN DE DATASETS (solo superadmin)
-if tab2 and es_superadmin:
-    with tab2:
-        st.markdown("## 📊 Edición de Datasets")
+def _reset_editor(dataset_sel: str):
+    """Callback: descarta las ediciones y vuelve a los datos originales"""
+    if f'df_edit_{dataset_sel}' in st.session_state:
+        del st.session_state[f'df_edit_{dataset_sel}']
+    if f'editor_{dataset_sel}' in st.session_state:
+        del st.session_state[f'editor_{dataset_sel}']
+
+@st.fragment
+def _dataset_editor():
+    """Editor de datasets (las ediciones solo re-ejecutan este fragmento)"""
+    datasets = {
+        "JUS": "data/Dataset_JUS.csv",
+        "IPC": "data/dataset_ipc.csv",
+        "RIPTE": "data/dataset_ripte.csv",
+        "Pisos Salariales": "data/dataset_pisos.csv",
+        "Tasa Activa": "data/dataset_tasa.csv"
+    }
+
+    # Columnas que se editan como fecha
+    columnas_fecha = {
+        "Tasa Activa": ("Desde",)
+    }
+
+    dataset_sel = st.selectbox("Seleccionar dataset", list(datasets.keys()))
+    archivo = datasets[dataset_sel]
+
+    try:
+        df = _load_csv(archivo, os.path.getmtime(archivo), columnas_fecha.get(dataset_sel, ()))
+    
+        st.markdown(f"### 📄 {dataset_sel}")
+        st.caption(f"📁 `{archivo}` • 📊 {len(df)} filas • 📋 {len(df.columns)} columnas")
     
-        datasets = {
-            "JUS": "data/Dataset_JUS.csv",
-            "IPC": "data/dataset_ipc.csv",
-            "RIPTE": "data/dataset_ripte.csv",
-            "Pisos Salariales": "data/dataset_pisos.csv",
-            "Tasa Activa": "data/dataset_tasa.csv"
+        st.markdown("---")
+          
+        # Sistema de edición custom
+        st.markdown("#### ✏️ Editor de Datos")
+    
+        # Configuración de columnas numéricas por dataset
+        columnas_config = {
+            "IPC": {
+                "variacion_mensual": st.column_config.NumberColumn("variacion_mensual", format="%.1f"),
+            },
+            "RIPTE": {
+                "año": st.column_config.NumberColumn("año", format="%d"),
+                "indice_ripte": st.column_config.NumberColumn("indice_ripte", format="%.2f"),
+                "variacion_mensual": st.column_config.NumberColumn("variacion_mensual", format="%.1f"),
+                "monto_en_pesos": st.column_config.NumberColumn("monto_en_pesos", format="%.2f"),
+            },
+            "Pisos Salariales": {
+                "monto_minimo": st.column_config.NumberColumn("monto_minimo", format="%d"),
+            },
+            "Tasa Activa": {
+                "Valor": st.column_config.NumberColumn("Valor", format="%.3f"),
+                "Desde": st.column_config.DateColumn("Desde", format="YYYY-MM-DD"),
+                "Año": st.column_config.NumberColumn("Año", format="%d"),
+                "Mes": st.column_config.NumberColumn("Mes", format="%d"),
+            },
         }
     
-        dataset_sel = st.selectbox("Seleccionar dataset", list(datasets.keys()))
-        archivo = datasets[dataset_sel]
+        # Editor de tabla completo (agregar/eliminar filas desde la grilla)
+        edited_df = st.data_editor(
+            df,
+            num_rows="dynamic",
+            use_container_width=True,
+            column_config=columnas_config.get(dataset_sel),
+            key=f"editor_{dataset_sel}"
+        )
+        st.session_state[f'df_edit_{dataset_sel}'] = edited_df
+        st.caption("✏️ Editá las celdas directamente • ➕ Agregá filas al final de la tabla • 🗑️ Seleccioná filas para eliminarlas")
     
-        try:
-            df = pd.read_csv(archivo, encoding='utf-8')
-        
-            st.markdown(f"### 📄 {dataset_sel}")
-            st.caption(f"📁 `{archivo}` • 📊 {len(df)} filas • 📋 {len(df.columns)} columnas")
-        
-            st.markdown("---")
-              
-            # Sistema de edición custom
-            st.markdown("#### ✏️ Editor de Datos")
-        
-            # CSS para compactar filas
-            st.markdown("""
-            <style>
-            /* Compactar contenedores */
-            div[data-testid="stVerticalBlock"] > div:has(div[data-testid="column"]) {
-                gap: 0.25rem !important;
-                margin-bottom: 0.25rem !important;
-            }
-        
-            /* Compactar inputs de texto */
-            div[data-testid="stTextInput"] > div {
-                margin-bottom: 0 !important;
-            }
-        
-            div[data-testid="stTextInput"] input {
-                padding: 0.25rem 0.5rem !important;
-                height: 2rem !important;
-                font-size: 0.85rem !important;
-            }
-        
-            /* Compactar botones */
-            button[kind="secondary"], button[kind="primary"] {
-                padding: 0.25rem 0.5rem !important;
-                min-height: 2rem !important;
-                height: 2rem !important;
-                font-size: 0.85rem !important;
-            }
-        
-            /* Compactar separadores */
-            hr {
-                margin: 0.25rem 0 !important;
-            }
-        
-            /* Compactar texto de filas */
-            .compact-text {
-                padding: 0.25rem 0.5rem;
-                font-size: 0.85rem;
-                line-height: 1.5;
-                margin: 0;
-            }
-            </style>
-            """, unsafe_allow_html=True)
-        
-            # Inicializar estado si no existe
-            if f'df_edit_{dataset_sel}' not in st.session_state:
-                st.session_state[f'df_edit_{dataset_sel}'] = df.copy()
-        
-            if f'editing_row_{dataset_sel}' not in st.session_state:
-                st.session_state[f'editing_row_{dataset_sel}'] = None
-        
-            # Estado de paginación
-            if f'rows_visible_{dataset_sel}' not in st.session_state:
-                st.session_state[f'rows_visible_{dataset_sel}'] = 10  # Mostrar 10 inicialmente
-        
-            df_trabajo = st.session_state[f'df_edit_{dataset_sel}']
-            rows_visible = st.session_state[f'rows_visible_{dataset_sel}']
-        
-            # Botón para agregar nueva fila - Pequeño a la izquierda
-            col_btn_agregar, col_espacio = st.columns([1, 5])
-            with col_btn_agregar:
-                if st.button("➕ Agregar", type="secondary", use_container_width=True, key=f"add_top_{dataset_sel}"):
-                    # Crear fila vacía
-                    nueva_fila = pd.DataFrame([{col: "" for col in df_trabajo.columns}])
-                    # Agregar al INICIO (arriba)
-                    df_trabajo = pd.concat([nueva_fila, df_trabajo], ignore_index=True)
-                    st.session_state[f'df_edit_{dataset_sel}'] = df_trabajo
-                    # Poner en modo edición la nueva fila (índice 0)
-                    st.session_state[f'editing_row_{dataset_sel}'] = 0
-                    st.rerun()
-        
-            st.markdown("")  # Pequeño espacio
-        
-            # ENCABEZADOS DE COLUMNAS
-            cols_header = st.columns([0.3] + [2] * len(df_trabajo.columns) + [0.8])
-        
-            with cols_header[0]:
-                st.markdown("<div class='compact-text'><b>#</b></div>", unsafe_allow_html=True)
-        
-            for col_idx, columna in enumerate(df_trabajo.columns):
-                with cols_header[col_idx + 1]:
-                    st.markdown(f"<div class='compact-text'><b>{columna}</b></div>", unsafe_allow_html=True)
-        
-            with cols_header[-1]:
-                st.markdown("<div class='compact-text'><b>Acciones</b></div>", unsafe_allow_html=True)
-        
-            st.markdown("<hr style='margin: 0.3rem 0; border-width: 2px; border-color: #333;'>", unsafe_allow_html=True)
-        
-            # Mostrar tabla con botones (solo filas visibles)
-            if len(df_trabajo) > 0:
-                # Determinar cuántas filas mostrar
-                filas_a_mostrar = min(rows_visible, len(df_trabajo))
-            
-                for idx in range(filas_a_mostrar):
-                    cols = st.columns([0.3] + [2] * len(df_trabajo.columns) + [0.8])
+        st.markdown("---")
+    
+        # Botones de acción
+        col1, col2, col3 = st.columns([2, 2, 6])
+    
+        with col1:
+            if st.button("💾 Guardar Cambios", type="primary", use_container_width=True):
+                try:
+                    df_trabajo = st.session_state[f'df_edit_{dataset_sel}']
                 
-                    # Número de fila
-                    with cols[0]:
-                        st.markdown(f"<div class='compact-text'><b>{idx}</b></div>", unsafe_allow_html=True)
+                    # Ordenar según el tipo de dataset
+                    if dataset_sel == "Tasa Activa":
+                        # Mantener orden descendente por fecha
+                        # 'Desde' ya es datetime desde la carga
+                        if 'Desde' in df_trabajo.columns:
+                            df_trabajo = df_trabajo.sort_values('Desde', ascending=False)
                 
-                    # Si está editando esta fila
-                    if st.session_state[f'editing_row_{dataset_sel}'] == idx:
-                        # Modo edición
-                        nuevos_valores = {}
-                        for col_idx, columna in enumerate(df_trabajo.columns):
-                            with cols[col_idx + 1]:
-                                valor_actual = df_trabajo.iloc[idx][columna]
-                                nuevos_valores[columna] = st.text_input(
-                                    columna,
-                                    value=str(valor_actual) if pd.notna(valor_actual) else "",
-                                    key=f"edit_{dataset_sel}_{idx}_{columna}",
-                                    label_visibility="collapsed"
-                                )
+                    # Fin de línea CRLF, igual que los CSV guardados en el repo
+                    df_trabajo.to_csv(archivo, index=False, encoding='utf-8', lineterminator='\r\n')
                     
-                        # Botones de acción
-                        with cols[-1]:
-                            col_save, col_cancel = st.columns(2)
-                            with col_save:
-                                if st.button("✅", key=f"save_{dataset_sel}_{idx}", help="Guardar"):
-                                    # Actualizar fila
-                                    for col, val in nuevos_valores.items():
-                                        df_trabajo.at[idx, col] = val
-                                    st.session_state[f'df_edit_{dataset_sel}'] = df_trabajo
-                                    st.session_state[f'editing_row_{dataset_sel}'] = None
-                                    st.rerun()
-                        
-                            with col_cancel:
-                                if st.button("❌", key=f"cancel_{dataset_sel}_{idx}", help="Cancelar"):
-                                    st.session_state[f'editing_row_{dataset_sel}'] = None
-                                    st.rerun()
-                    else:
-                        # Modo visualización
-                        for col_idx, columna in enumerate(df_trabajo.columns):
-                            with cols[col_idx + 1]:
-                                valor = df_trabajo.iloc[idx][columna]
-                                st.markdown(f"<div class='compact-text'>{str(valor) if pd.notna(valor) else ''}</div>", unsafe_allow_html=True)
+                    # INVALIDAR CACHÉ - Las otras apps verán los datos actualizados
+                    st.cache_data.clear()
                     
-                        # Botones de acción
-                        with cols[-1]:
-                            col_edit, col_delete = st.columns(2)
-                            with col_edit:
-                                if st.button("✏️", key=f"edit_btn_{dataset_sel}_{idx}", help="Editar"):
-                                    st.session_state[f'editing_row_{dataset_sel}'] = idx
-                                    st.rerun()
-                        
-                            with col_delete:
-                                if st.button("🗑️", key=f"delete_{dataset_sel}_{idx}", help="Eliminar"):
-                                    df_trabajo = df_trabajo.drop(idx).reset_index(drop=True)
-                                    st.session_state[f'df_edit_{dataset_sel}'] = df_trabajo
-                                    st.rerun()
-                
-                    st.markdown("<hr style='margin: 0.15rem 0; border-color: #e0e0e0;'>", unsafe_allow_html=True)
-            
-                # Botones de paginación
-                total_filas = len(df_trabajo)
-                if total_filas > 10:
-                    st.markdown("")  # Espacio
+                    st.success("✅ Cambios guardados exitosamente")
                 
-                    col_pag1, col_pag2, col_pag3, col_pag4 = st.columns([2, 2, 2, 4])
-                
-                    with col_pag1:
-                        # Botón cargar 10 más
-                        if rows_visible < total_filas:
-                            if st.button("⬇️ Cargar 10 más", use_container_width=True, key=f"load_more_{dataset_sel}"):
-                                st.session_state[f'rows_visible_{dataset_sel}'] = min(rows_visible + 10, total_filas)
-                                st.rerun()
-                
-                    with col_pag2:
-                        # Botón mostrar todo
-                        if rows_visible < total_filas:
-                            if st.button("📄 Mostrar Todo", use_container_width=True, key=f"show_all_{dataset_sel}"):
-                                st.session_state[f'rows_visible_{dataset_sel}'] = total_filas
-                                st.rerun()
-                
-                    with col_pag3:
-                        # Botón colapsar
-                        if rows_visible > 10:
-                            if st.button("⬆️ Mostrar menos", use_container_width=True, key=f"collapse_{dataset_sel}"):
-                                st.session_state[f'rows_visible_{dataset_sel}'] = 10
-                                st.rerun()
-                
-                    with col_pag4:
-                        st.caption(f"Mostrando {rows_visible} de {total_filas} filas")
-        
-            else:
-                st.info("📝 No hay datos. Usa el botón '➕ Agregar' de arriba para comenzar.")
-        
-            st.markdown("---")
-        
-            # Botones de acción
-            col1, col2, col3 = st.columns([2, 2, 6])
-        
-            with col1:
-                if st.button("💾 Guardar Cambios", type="primary", use_container_width=True):
-                    try:
-                        df_trabajo = st.session_state[f'df_edit_{dataset_sel}']
-                    
-                        # Ordenar según el tipo de dataset
-                        if dataset_sel == "Tasa Activa":
-                            # Mantener orden descendente por fecha
-                            if 'Desde' in df_trabajo.columns:
-                                df_trabajo['Desde'] = pd.to_datetime(
-                                    df_trabajo['Desde'],
-                                    dayfirst=True,
-                                    format='mixed'
-                                )
-                                df_trabajo = df_trabajo.sort_values('Desde', ascending=False)
-                    
-                        df_trabajo.to_csv(archivo, index=False, encoding='utf-8')
-                        
-                        # INVALIDAR CACHÉ - Las otras apps verán los datos actualizados
-                        st.cache_data.clear()
-                        
-                        st.success("✅ Cambios guardados exitosamente")
-                    
-                        # Resetear estado
-                        del st.session_state[f'df_edit_{dataset_sel}']
-                        del st.session_state[f'editing_row_{dataset_sel}']
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"❌ Error al guardar: {str(e)}")
-        
-            with col2:
-                csv = df.to_csv(index=False).encode('utf-8')
-                st.download_button(
-                    label="📥 Descargar",
-                    data=csv,
-                    file_name=f"{dataset_sel}_{pd.Timestamp.now().strftime('%Y%m%d')}.csv",
-                    mime="text/csv",
-                    use_container_width=True
-                )
-        
-            with col3:
-                if st.button("🔄 Recargar Original", use_container_width=True):
-                    # Resetear a los datos originales
-                    if f'df_edit_{dataset_sel}' in st.session_state:
-                        del st.session_state[f'df_edit_{dataset_sel}']
-                    if f'editing_row_{dataset_sel}' in st.session_state:
-                        del st.session_state[f'editing_row_{dataset_sel}']
+                    # Resetear estado
+                    del st.session_state[f'df_edit_{dataset_sel}']
+                    if f'editor_{dataset_sel}' in st.session_state:
+                        del st.session_state[f'editor_{dataset_sel}']
                     st.rerun()
+                except Exception as e:
+                    st.error(f"❌ Error al guardar: {str(e)}")
+    
+        with col2:
+            csv = _encode_csv(df)
+            st.download_button(
+                label="📥 Descargar",
+                data=csv,
+                file_name=f"{dataset_sel}_{pd.Timestamp.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv",
+                use_container_width=True
+            )
     
-        except Exception as e:
-            st.error(f"❌ Error al cargar dataset: {str(e)}")
-            st.exception(e)
+        with col3:
+            st.button("🔄 Recargar Original", use_container_width=True,
+                      on_click=_reset_editor, args=(dataset_sel,))
+
+    except Exception as e:
+        st.error(f"❌ Error al cargar dataset: {str(e)}")
+        st.exception(e)
+
+if tab2 and es_superadmin:
+    with tab2:
+        st.markdown("## 📊 Edición de Datasets")
+        _dataset_editor()
 
 # TAB 3: REPORTES DE AUDITORÍA (solo superadmin)
 if tab3 and es_superadmin:
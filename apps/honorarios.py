@@ -8,7 +8,7 @@ Sistema de conversión a JUS y regulación según Ley 24432
 import streamlit as st
 import pandas as pd
 from datetime import datetime, date
-from utils.data_loader import get_ultimo_dato
+from utils.data_loader import get_ultimo_dato, parse_valor_ius
 from utils.navegacion import mostrar_sidebar_navegacion
 from utils.info_datasets import mostrar_ultimos_datos
 from utils.formatters import formato_moneda
@@ -20,12 +20,10 @@ mostrar_sidebar_navegacion('honorarios')
 @st.cache_data
 def cargar_dataset_jus():
     """Carga el dataset de valores JUS"""
-    df = pd.read_csv("data/Dataset_JUS.csv", encoding='utf-8')
+    df = pd.read_csv("data/Dataset_JUS.csv", encoding='utf-8', converters={'VALOR IUS': parse_valor_ius})
     df.columns = df.columns.str.strip()
     df['FECHA ENTRADA EN VIGENCIA'] = pd.to_datetime(df['FECHA ENTRADA EN VIGENCIA'], dayfirst=True)
     df['FECHA DE FINALIZACION'] = pd.to_datetime(df['FECHA DE FINALIZACION'], dayfirst=True, errors='coerce')
-    df['VALOR IUS'] = df['VALOR IUS'].str.replace('$', '').str.replace('.', '').str.replace(',', '.').str.strip()
-    df['VALOR IUS'] = pd.to_numeric(df['VALOR IUS'])
     return df
 
 # Función para convertir pesos a JUS
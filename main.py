@@ -11,8 +11,10 @@ import streamlit as st
 from pathlib import Path
 import sys
 
-# Configurar el path para importar módulos
-sys.path.insert(0, str(Path(__file__).parent))
+# Configurar el path para importar módulos (una sola vez: el script se re-ejecuta en cada rerun)
+_p = str(Path(__file__).parent)
+if _p not in sys.path:
+    sys.path.insert(0, _p)
 
 # Importar módulo de autenticación
 from utils.auth import AuthSystem
@@ -10,7 +10,8 @@ from .data_loader import (
     cargar_dataset_pisos,
     cargar_dataset_ripte,
     cargar_dataset_tasa,
-    get_ultimo_dato
+    get_ultimo_dato,
+    parse_valor_ius
 )
 
 from .auth import AuthSystem
@@ -19,15 +20,18 @@ from .navegacion import mostrar_sidebar_navegacion
 
 from .formatters import (
     formato_moneda,
+    formato_moneda_series,
     safe_parse_date,
     numero_a_letras,
     days_in_month,
     redondear_decimal,
+    redondear_decimal_array,
     limpiar_valor_monetario,
     formato_porcentaje,
     formato_fecha_argentina,
     MESES_ES,
-    MESES_ES_CORTO
+    MESES_ES_CORTO,
+    MESES_ES_INV
 )
 
 __all__ = [
@@ -38,17 +42,21 @@ __all__ = [
     'cargar_dataset_ripte',
     'cargar_dataset_tasa',
     'get_ultimo_dato',
+    'parse_valor_ius',
     'AuthSystem',
     'SimpleSessionManager',
     'mostrar_sidebar_navegacion',
     'formato_moneda',
+    'formato_moneda_series',
     'safe_parse_date',
     'numero_a_letras',
     'days_in_month',
     'redondear_decimal',
+    'redondear_decimal_array',
     'limpiar_valor_monetario',
     'formato_porcentaje',
     'formato_fecha_argentina',
     'MESES_ES',
-    'MESES_ES_CORTO'
+    'MESES_ES_CORTO',
+    'MESES_ES_INV'
 ]
\ No newline at end of file
@@ -1,30 +1,44 @@
 
+import os
 import streamlit as st
 from utils.data_loader import DataLoader
 
-def mostrar_alerta_ultimos_datos():
-    try:
-        dl = DataLoader()
 
-        df_ripte = dl.cargar_dataset("ripte")
-        df_ipc = dl.cargar_dataset("ipc")
-        df_tasa = dl.cargar_dataset("tasa")
-        df_jus = dl.cargar_dataset("jus")
+@st.cache_resource
+def _get_loader() -> DataLoader:
+    """Instancia compartida de DataLoader"""
+    return DataLoader()
+
+
+@st.cache_data(ttl=300)
+def _get_last(name: str, mtime: float):
+    """Último dato de un dataset (mtime invalida la caché cuando el CSV cambia)"""
+    dl = _get_loader()
+    # Los datasets tienen el dato más reciente arriba: basta con leer la primera fila
+    # mtime también va a cargar_dataset, que tiene su propia caché de 1 hora
+    return dl.get_ultimo_dato(dl.cargar_dataset(name, mtime=mtime, nrows=1))
+
 
-        ult_ripte = dl.get_ultimo_dato(df_ripte)
-        ult_ipc   = dl.get_ultimo_dato(df_ipc)
-        ult_tasa  = dl.get_ultimo_dato(df_tasa)
-        ult_jus   = dl.get_ultimo_dato(df_jus)
+def _mtime(name: str) -> float:
+    return os.path.getmtime(DataLoader.DATA_DIR / DataLoader.DATASETS[name])
+
+
+def mostrar_alerta_ultimos_datos():
+    try:
+        ult_ripte = _get_last("ripte", _mtime("ripte"))
+        ult_ipc   = _get_last("ipc", _mtime("ipc"))
+        ult_tasa  = _get_last("tasa", _mtime("tasa"))
+        ult_jus   = _get_last("jus", _mtime("jus"))
 
         html = f"""
         <div style='margin-top:45px; background:#E6ECF2; padding:14px 18px;
                     border-left:5px solid #2A4C7C; border-radius:6px;
                     font-size:0.92rem;'>
             <strong>Últimos datos disponibles</strong><br>
-            • RIPTE: {ult_ripte['Valor']} ({ult_ripte['Fecha']})<br>
-            • IPC: {ult_ipc['Valor']} ({ult_ipc['Mes']})<br>
-            • Tasa Activa: {ult_tasa['Valor']} ({ult_tasa['Fecha']})<br>
-            • JUS: {ult_jus['Valor']} ({ult_jus['Fecha']})<br>
+            • RIPTE: {ult_ripte['indice_ripte']} ({str(ult_ripte['mes']).strip()} {ult_ripte['año']})<br>
+            • IPC: {ult_ipc['variacion_mensual']}% ({ult_ipc['periodo']})<br>
+            • Tasa Activa: {ult_tasa['Valor']} ({ult_tasa['Hasta']})<br>
+            • JUS: ${ult_jus['VALOR IUS']:,.2f} ({ult_jus['FECHA ENTRADA EN VIGENCIA ']})<br>
         </div>
         """
 
@@ -14,6 +14,18 @@ from typing import Optional, Dict, Any
 import streamlit as st
 from datetime import datetime
 
+
+def parse_valor_ius(valor: str) -> float:
+    """
+    Convierte 'VALOR IUS' ("$ 44.330") a float.
+    
+    Pensado como converter de pd.read_csv para Dataset_JUS.csv, así el
+    valor se parsea una sola vez al leer el archivo.
+    """
+    valor = valor.replace('$', '').replace('.', '').replace(',', '.').strip()
+    return float(valor) if valor else float('nan')
+
+
 class DataLoader:
     """Clase para cargar y gestionar datasets del sistema"""
     
@@ -84,12 +96,15 @@ class DataLoader:
         return self.DATA_DIR / self.DATASETS[dataset_key]
     
     @st.cache_data(ttl=3600)  # Cache por 1 hora
-    def cargar_dataset(_self, dataset_key: str, **kwargs) -> pd.DataFrame:
+    def cargar_dataset(_self, dataset_key: str, mtime: Optional[float] = None, **kwargs) -> pd.DataFrame:
         """
         Carga un dataset desde el directorio data/
         
         Args:
             dataset_key: Clave del dataset a cargar
+            mtime: Fecha de modificación del CSV. No se usa para leer: solo entra
+                en la clave de caché, para que un archivo reemplazado no se
+                sirva viejo hasta que venza el TTL
             **kwargs: Argumentos adicionales para pd.read_csv()
         
         Returns:
@@ -135,7 +150,8 @@ class DataLoader:
         configs = {
             'jus': {
                 'encoding': 'utf-8',
-                'parse_dates': ['Fecha'] if 'Fecha' in self._peek_columns(dataset_key) else []
+                'parse_dates': ['Fecha'] if 'Fecha' in self._peek_columns(dataset_key) else [],
+                'converters': {'VALOR IUS': parse_valor_ius}
             },
             'ipc': {
                 'encoding': 'utf-8',
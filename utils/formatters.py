@@ -9,18 +9,34 @@ que son compartidas entre múltiples aplicaciones del sistema.
 
 Funciones disponibles:
 - formato_moneda: Formatea números como moneda argentina
+- formato_moneda_series: Versión vectorizada de formato_moneda para Series
 - safe_parse_date: Parser robusto de fechas
 - numero_a_letras: Convierte números a texto en español
 - days_in_month: Calcula días en un mes
 - redondear_decimal: Redondeo con ROUND_HALF_UP (legal)
+- redondear_decimal_array: Versión vectorizada de redondear_decimal
 """
 
+import numpy as np
 import pandas as pd
+import functools
 import math
+import numbers
+import re
 from datetime import datetime, date
 from decimal import Decimal, ROUND_HALF_UP
 from typing import Optional
 
+try:
+    # Opcional: parser ISO 8601 en C para safe_parse_date
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = None
+
+
+# Intercambio de separadores "1,234.56" → "1.234,56" en una sola pasada
+_MONEY_TRANS = str.maketrans({',': '.', '.': ','})
+
 
 def formato_moneda(valor) -> str:
     """
@@ -39,11 +55,83 @@ def formato_moneda(valor) -> str:
         '$ 0,00'
         >>> formato_moneda(None)
         '$ 0,00'
+        >>> formato_moneda(float('nan'))
+        '$ 0,00'
     """
-    try:
-        return f"$ {valor:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-    except:
+    # valor != valor: NaN de cualquier tipo (float, numpy, Decimal)
+    if not isinstance(valor, numbers.Number) or valor != valor:
         return "$ 0,00"
+    return f"$ {valor:,.2f}".translate(_MONEY_TRANS)
+
+
+def formato_moneda_series(serie: pd.Series) -> pd.Series:
+    """
+    Versión vectorizada de formato_moneda para columnas completas.
+    
+    Igual que formato_moneda, los valores nulos, NaN o no numéricos
+    se muestran como "$ 0,00".
+    
+    Args:
+        serie: Serie numérica
+    
+    Returns:
+        Serie de strings con formato: "$ 1.234.567,89"
+    
+    Ejemplos:
+        >>> formato_moneda_series(pd.Series([1234567.89, None, "x"]))
+        0    $ 1.234.567,89
+        1            $ 0,00
+        2            $ 0,00
+        dtype: object
+    """
+    if not pd.api.types.is_numeric_dtype(serie):
+        serie = serie.where(serie.map(lambda v: isinstance(v, numbers.Number)))
+    # astype(object): en una Serie vacía map conserva float64 y la suma con "$ " falla
+    formateado = "$ " + serie.astype(float).fillna(0).map("{:,.2f}".format).astype(object)
+    return formateado.str.translate(_MONEY_TRANS)
+
+
+# Formas numéricas reconocidas por safe_parse_date:
+# dd/mm/aaaa, dd-mm-aaaa, aaaa-mm-dd, aaaa/mm/dd (opcionalmente con hh:mm:ss),
+# mm/aaaa, mm-aaaa, aaaa-mm, aaaa/mm
+_SHAPE_RE = re.compile(
+    r'^(\d{1,4})([/\-])(\d{1,4})(?:\2(\d{1,4}))?'
+    r'(?:[ T](\d{1,2}):(\d{1,2}):(\d{1,2}))?$'
+)
+
+
+def _fecha_desde_partes(a, sep, b, c, hh, mm, ss) -> Optional[date]:
+    """
+    Arma la fecha a partir de los grupos de _SHAPE_RE.
+    
+    Retorna None si la forma no es una de las soportadas o la fecha es
+    inválida, para que safe_parse_date siga con los intentos de respaldo.
+    """
+    if hh is not None:
+        if c is None or int(hh) > 23 or int(mm) > 59 or int(ss) > 61:
+            return None
+    
+    if c is None:
+        # Mes/Año: retornar primer día del mes
+        if len(b) == 4 and len(a) <= 2:
+            year, month, day = int(b), int(a), 1
+        elif len(a) == 4 and len(b) <= 2:
+            year, month, day = int(a), int(b), 1
+        else:
+            return None
+    elif len(c) == 4 and len(a) <= 2 and len(b) <= 2:
+        year, month, day = int(c), int(b), int(a)
+    elif len(a) == 4 and len(b) <= 2 and len(c) <= 2:
+        year, month, day = int(a), int(b), int(c)
+    else:
+        return None
+    
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        return None
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
 
 
 def safe_parse_date(s) -> Optional[date]:
@@ -83,34 +171,47 @@ def safe_parse_date(s) -> Optional[date]:
     
     # Convertir a string y limpiar
     s = str(s).strip()
-    if not s:
+    # Descarte rápido: ningún formato soportado es tan corto/largo o no tiene dígitos
+    if len(s) < 4 or len(s) > 32 or not any(c.isdigit() for c in s):
         return None
     
-    # Intentar formatos estándar
-    fmts = [
-        "%Y-%m-%d",           # ISO: 2024-12-31
-        "%d/%m/%Y",           # AR: 31/12/2024
-        "%d-%m-%Y",           # AR con guión: 31-12-2024
-        "%m/%Y",              # Mes/Año: 12/2024
-        "%Y/%m/%d",           # Año primero con /
-        "%Y-%m",              # Año-Mes: 2024-12
-        "%Y-%m-%d %H:%M:%S",  # ISO con hora
-        "%d/%m/%Y %H:%M:%S",  # AR con hora
-        "%B %Y",              # Diciembre 2024
-        "%b %Y",              # Dic 2024
-        "%Y/%m",              # 2024/12
-        "%m-%Y",              # 12-2024
-    ]
-    
-    for f in fmts:
+    return _parse_str(s)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_str(s: str) -> Optional[date]:
+    """
+    Parseo de fechas en texto para safe_parse_date.
+    
+    Memoizado: los CSV repiten mucho las mismas fechas (períodos mensuales),
+    y date es inmutable, así que el resultado se puede compartir.
+    Usar _parse_str.cache_clear() para vaciar la caché.
+    """
+    # ISO (aaaa-mm, aaaa-mm-dd, con hora o zona) vía ciso8601 si está instalado.
+    # Solo las formas que el resto del parseo también acepta: el resultado no
+    # debe depender de tener el paquete. Quedan afuera las semanas (2024-W01),
+    # las fechas ordinales (2024-366) y la hora 24, que ciso8601 pasa al día siguiente
+    if (_parse_iso is not None and s[4:5] == '-' and s[5:7].isdigit()
+            and s[7:8] in ('', '-') and s[11:13] != '24'):
         try:
-            dt = datetime.strptime(s, f)
-            # Para formatos mes/año, retornar primer día del mes
-            if f in ("%m/%Y", "%Y-%m", "%Y/%m", "%m-%Y", "%B %Y", "%b %Y"):
-                return date(dt.year, dt.month, 1)
-            return dt.date()
-        except Exception:
-            continue
+            return _parse_iso(s).date()
+        except ValueError:
+            pass
+    
+    # Fechas numéricas: clasificar por forma y construir la fecha directamente
+    m = _SHAPE_RE.match(s)
+    if m:
+        resultado = _fecha_desde_partes(*m.groups())
+        if resultado is not None:
+            return resultado
+    else:
+        # Mes en letras + año: "Diciembre 2024", "Dic 2024", "December 2024"
+        partes = s.lower().split()
+        if len(partes) == 2 and len(partes[1]) == 4 and partes[1].isdigit():
+            mes = _MESES_NOMBRE.get(partes[0])
+            year = int(partes[1])
+            if mes is not None and year >= 1:
+                return date(year, mes, 1)
     
     # Intentar parsear mes/año manualmente
     if "/" in s or "-" in s:
@@ -135,24 +236,8 @@ def safe_parse_date(s) -> Optional[date]:
         return None
 
 
-def numero_a_letras(numero: float) -> str:
-    """
-    Convierte un número a su representación en letras (pesos argentinos).
-    
-    Args:
-        numero: Número a convertir (admite decimales)
-    
-    Returns:
-        String con el número en letras, formato: "PESOS ... CON XX/100"
-    
-    Ejemplos:
-        >>> numero_a_letras(1234.56)
-        'PESOS UN MIL DOSCIENTOS TREINTA Y CUATRO CON 56/100'
-        >>> numero_a_letras(0)
-        'CERO PESOS'
-        >>> numero_a_letras(1000000)
-        'PESOS UN MILLÓN CON 00/100'
-    """
+def _build_grupo() -> tuple:
+    """Arma la tabla de 0-999 a letras usada por numero_a_letras"""
     unidades = ['', 'UN', 'DOS', 'TRES', 'CUATRO', 'CINCO', 'SEIS', 'SIETE', 'OCHO', 'NUEVE']
     decenas = ['', '', 'VEINTE', 'TREINTA', 'CUARENTA', 'CINCUENTA', 'SESENTA', 'SETENTA', 'OCHENTA', 'NOVENTA']
     especiales = ['DIEZ', 'ONCE', 'DOCE', 'TRECE', 'CATORCE', 'QUINCE', 'DIECISÉIS', 'DIECISIETE', 'DIECIOCHO', 'DIECINUEVE']
@@ -183,54 +268,66 @@ def numero_a_letras(numero: float) -> str:
             else:
                 return centenas[cen] + ' ' + convertir_grupo(resto)
     
+    return tuple(convertir_grupo(i) for i in range(1000))
+
+
+# Tabla precalculada: _GRUPO[n] es el texto de n (0-999)
+_GRUPO = _build_grupo()
+
+
+def numero_a_letras(numero: float) -> str:
+    """
+    Convierte un número a su representación en letras (pesos argentinos).
+    
+    Args:
+        numero: Número a convertir (admite decimales)
+    
+    Returns:
+        String con el número en letras, formato: "PESOS ... CON XX/100"
+    
+    Raises:
+        ValueError: Si el número es negativo
+    
+    Ejemplos:
+        >>> numero_a_letras(1234.56)
+        'PESOS UN MIL DOSCIENTOS TREINTA Y CUATRO CON 56/100'
+        >>> numero_a_letras(0)
+        'CERO PESOS'
+        >>> numero_a_letras(1000000)
+        'PESOS UN MILLÓN CON 00/100'
+    """
     if numero == 0:
         return 'CERO PESOS'
+    if numero < 0:
+        # divmod sobre negativos da grupos sin sentido: mejor fallar que escribir un monto equivocado
+        raise ValueError(f"numero_a_letras no admite montos negativos: {numero}")
     
     entero = int(numero)
     decimal = int(round((numero - entero) * 100))
     
-    # Manejar miles de millones
-    if entero >= 1000000000:
-        miles_millon = entero // 1000000000
-        resto = entero % 1000000000
-        texto = convertir_grupo(miles_millon) + ' MIL'
-        if resto >= 1000000:
-            millones = resto // 1000000
-            resto = resto % 1000000
-            texto += ' ' + (convertir_grupo(millones) if millones > 1 else 'UN') + ' MILLÓN' + ('ES' if millones > 1 else '')
-        if resto > 0:
-            if resto >= 1000:
-                miles = resto // 1000
-                resto = resto % 1000
-                texto += ' ' + convertir_grupo(miles) + ' MIL'
-            if resto > 0:
-                texto += ' ' + convertir_grupo(resto)
-    # Manejar millones
-    elif entero >= 1000000:
-        millones = entero // 1000000
-        resto = entero % 1000000
-        texto = (convertir_grupo(millones) if millones > 1 else 'UN') + ' MILLÓN' + ('ES' if millones > 1 else '')
-        if resto > 0:
-            if resto >= 1000:
-                miles = resto // 1000
-                resto = resto % 1000
-                texto += ' ' + convertir_grupo(miles) + ' MIL'
-            if resto > 0:
-                texto += ' ' + convertir_grupo(resto)
-    # Manejar miles
-    elif entero >= 1000:
-        miles = entero // 1000
-        resto = entero % 1000
-        texto = convertir_grupo(miles) + ' MIL'
-        if resto > 0:
-            texto += ' ' + convertir_grupo(resto)
-    # Menores a mil
-    else:
-        texto = convertir_grupo(entero)
+    # Separar en grupos de tres cifras
+    miles_millon, resto = divmod(entero, 1000000000)
+    millones, resto = divmod(resto, 1000000)
+    miles, resto = divmod(resto, 1000)
+    
+    partes = []
+    if miles_millon:
+        partes.append(_GRUPO[miles_millon] + ' MIL')
+    if millones:
+        partes.append((_GRUPO[millones] + ' MILLÓNES') if millones > 1 else 'UN MILLÓN')
+    if miles:
+        partes.append(_GRUPO[miles] + ' MIL')
+    if resto:
+        partes.append(_GRUPO[resto])
+    texto = ' '.join(partes)
     
     return f'PESOS {texto} CON {decimal:02d}/100'
 
 
+# Días por mes en un año no bisiesto
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
 def days_in_month(d: date) -> int:
     """
     Calcula la cantidad de días en un mes dado.
@@ -249,11 +346,22 @@ def days_in_month(d: date) -> int:
         >>> days_in_month(date(2024, 12, 1))
         31
     """
-    if d.month == 12:
-        nxt = date(d.year + 1, 1, 1)
-    else:
-        nxt = date(d.year, d.month + 1, 1)
-    return (nxt - date(d.year, d.month, 1)).days
+    if d.month != 2:
+        return _DAYS_IN_MONTH[d.month - 1]
+    y = d.year
+    return 29 if (y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)) else 28
+
+
+# Cuantizadores de redondear_decimal, uno por cantidad de decimales
+_QUANT_CACHE: dict = {}
+
+
+def _quantizer(decimales: int) -> Decimal:
+    """Decimal(10) ** -decimales, calculado una sola vez por valor"""
+    q = _QUANT_CACHE.get(decimales)
+    if q is None:
+        q = _QUANT_CACHE[decimales] = Decimal(10) ** -decimales
+    return q
 
 
 def redondear_decimal(valor, decimales: int = 2) -> float:
@@ -283,12 +391,48 @@ def redondear_decimal(valor, decimales: int = 2) -> float:
         ROUND_HALF_UP: 0.5 redondea hacia arriba (no hacia el par más cercano)
         Ejemplo: 2.5 → 3.0 (no 2.0)
     """
-    d = Decimal(str(valor))
-    return float(d.quantize(Decimal(10) ** -decimales, rounding=ROUND_HALF_UP))
+    d = valor if isinstance(valor, Decimal) else Decimal(str(valor))
+    return float(d.quantize(_quantizer(decimales), rounding=ROUND_HALF_UP))
+
+
+def redondear_decimal_array(valores, decimales: int = 2) -> np.ndarray:
+    """
+    Redondeo ROUND_HALF_UP vectorizado para arrays/Series completos.
+    
+    Equivale a aplicar redondear_decimal elemento por elemento, pero en
+    una sola operación de NumPy. Trabaja en punto flotante (no Decimal):
+    el producto se corrige en 4 ulp para que los casos x.xx5 que float
+    representa apenas por debajo (ej: 1.235 * 100 = 123.4999...) suban
+    como en la versión Decimal. Es exacto mientras el valor escalado
+    tenga hasta ~15 cifras significativas (montos de hasta ~$10¹³ con
+    2 decimales). Para valores puntuales en cálculos legales usar
+    redondear_decimal.
+    
+    Args:
+        valores: Array, lista o Serie numérica
+        decimales: Cantidad de decimales (default: 2)
+    
+    Returns:
+        np.ndarray de float con los valores redondeados
+    
+    Ejemplos:
+        >>> redondear_decimal_array([1.235, 1.234, -2.5], 2)
+        array([ 1.24,  1.23, -2.5 ])
+        >>> redondear_decimal_array([2.5, 3.5], 0)
+        array([3., 4.])
+    """
+    arr = np.asarray(valores, dtype=float)
+    factor = 10.0 ** decimales
+    escalado = np.abs(arr) * factor * (1 + 4 * np.finfo(float).eps)
+    return np.sign(arr) * np.floor(escalado + 0.5) / factor
 
 
 # Funciones auxiliares adicionales
 
+# Caracteres que limpiar_valor_monetario descarta en una sola pasada
+_STRIP_MONEY = str.maketrans('', '', '$ ')
+
+
 def limpiar_valor_monetario(valor_str: str) -> float:
     """
     Limpia un string monetario y lo convierte a float.
@@ -309,7 +453,7 @@ def limpiar_valor_monetario(valor_str: str) -> float:
     """
     try:
         # Quitar símbolos y espacios
-        limpio = valor_str.replace('$', '').replace(' ', '').strip()
+        limpio = valor_str.translate(_STRIP_MONEY).strip()
         
         # Detectar si usa coma como decimal (formato argentino)
         if ',' in limpio and '.' in limpio:
@@ -320,7 +464,7 @@ def limpiar_valor_monetario(valor_str: str) -> float:
             limpio = limpio.replace(',', '.')
         
         return float(limpio)
-    except:
+    except (TypeError, ValueError, AttributeError):
         return 0.0
 
 
@@ -344,7 +488,7 @@ def formato_porcentaje(valor: float, decimales: int = 2) -> str:
     try:
         porcentaje = valor * 100
         return f"{porcentaje:.{decimales}f}%".replace(".", ",")
-    except:
+    except (TypeError, ValueError, AttributeError):
         return "0,00%"
 
 
@@ -361,6 +505,23 @@ MESES_ES_CORTO = {
     9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dic'
 }
 
+# Inverso de MESES_ES y MESES_ES_CORTO: nombre en minúscula → número de mes
+# Ej: MESES_ES_INV['diciembre'] == MESES_ES_INV['dic'] == 12
+MESES_ES_INV = {
+    **{v.lower(): k for k, v in MESES_ES.items()},
+    **{v.lower(): k for k, v in MESES_ES_CORTO.items()},
+}
+
+# Nombres de mes (minúscula) → número, usado por safe_parse_date.
+# Incluye los nombres en inglés que aceptaba el parseo con strptime (%B / %b)
+_MESES_EN = ('january', 'february', 'march', 'april', 'may', 'june', 'july',
+             'august', 'september', 'october', 'november', 'december')
+_MESES_NOMBRE = {
+    **MESES_ES_INV,
+    **{nombre: k for k, nombre in enumerate(_MESES_EN, 1)},
+    **{nombre[:3]: k for k, nombre in enumerate(_MESES_EN, 1)},
+}
+
 
 def formato_fecha_argentina(fecha: date, formato: str = "largo") -> str:
     """
@@ -380,12 +541,12 @@ def formato_fecha_argentina(fecha: date, formato: str = "largo") -> str:
         '31 de Diciembre de 2024'
     """
     if formato == "corto":
-        return fecha.strftime("%d/%m/%y")
+        return f"{fecha.day:02d}/{fecha.month:02d}/{fecha.year % 100:02d}"
     elif formato == "texto":
         mes_nombre = MESES_ES[fecha.month]
         return f"{fecha.day} de {mes_nombre} de {fecha.year}"
     else:  # largo (default)
-        return fecha.strftime("%d/%m/%Y")
+        return f"{fecha.day:02d}/{fecha.month:02d}/{fecha.year:04d}"
 
 
 if __name__ == "__main__":
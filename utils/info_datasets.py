@@ -4,8 +4,20 @@
 Utilidades para mostrar información de últimos datos de datasets
 """
 
+import os
 import streamlit as st
 import pandas as pd
+from typing import NamedTuple
+from utils.formatters import MESES_ES_INV
+from utils.data_loader import parse_valor_ius
+
+
+def _ultimo_registro(data_manager, nombre: str, posicion: int = 0):
+    """Registro en la posición dada de <nombre>_data (None si no hay datos)"""
+    df = getattr(data_manager, f'{nombre}_data', None)
+    if df is None or df.empty:
+        return None
+    return df.iloc[posicion]
 
 
 def mostrar_ultimos_datos(data_manager):
@@ -18,36 +30,33 @@ def mostrar_ultimos_datos(data_manager):
     Nota:
         Los datasets deben estar ordenados de más reciente a más antiguo (excepto pisos que tiene sort)
     """
+    parts = []
     
     # Obtener último RIPTE (primer registro ya que CSV está invertido)
-    ripte_info = "N/A"
-    if hasattr(data_manager, 'ripte_data') and not data_manager.ripte_data.empty:
-        ultimo_ripte = data_manager.ripte_data.iloc[0]
+    ultimo_ripte = _ultimo_registro(data_manager, 'ripte')
+    if ultimo_ripte is not None:
         fecha_ripte = ultimo_ripte['fecha']
         valor_ripte = ultimo_ripte['ripte']
-        ripte_info = f"**RIPTE** {fecha_ripte.month}/{fecha_ripte.year}: {valor_ripte:,.2f}"
+        parts.append(f"**RIPTE** {fecha_ripte.month}/{fecha_ripte.year}: {valor_ripte:,.2f}")
     
     # Obtener último IPC
-    ipc_info = "N/A"
-    if hasattr(data_manager, 'ipc_data') and not data_manager.ipc_data.empty:
-        ultimo_ipc = data_manager.ipc_data.iloc[0]
+    ultimo_ipc = _ultimo_registro(data_manager, 'ipc')
+    if ultimo_ipc is not None:
         fecha_ipc = ultimo_ipc['fecha']
         valor_ipc = ultimo_ipc['ipc']
-        ipc_info = f"**IPC** {fecha_ipc.month}/{fecha_ipc.year}: {valor_ipc:.2f}%"
+        parts.append(f"**IPC** {fecha_ipc.month}/{fecha_ipc.year}: {valor_ipc:.2f}%")
     
     # Obtener última Tasa Activa
-    tasa_info = "N/A"
-    if hasattr(data_manager, 'tasa_data') and not data_manager.tasa_data.empty:
-        ultima_tasa = data_manager.tasa_data.iloc[0]
+    ultima_tasa = _ultimo_registro(data_manager, 'tasa')
+    if ultima_tasa is not None:
         fecha_tasa = ultima_tasa['desde']
         valor_tasa = ultima_tasa['tasa']
-        tasa_info = f"**TASA ACTIVA** {fecha_tasa.day}/{fecha_tasa.month}/{fecha_tasa.year}: {valor_tasa:.2f}%"
+        parts.append(f"**TASA ACTIVA** {fecha_tasa.day}/{fecha_tasa.month}/{fecha_tasa.year}: {valor_tasa:.2f}%")
     
     # Obtener último Piso SRT
-    piso_info = "N/A"
-    if hasattr(data_manager, 'pisos_data') and not data_manager.pisos_data.empty:
-        # Pisos tiene sort, así que el último es el más reciente
-        ultimo_piso = data_manager.pisos_data.iloc[-1]
+    # Pisos tiene sort, así que el último es el más reciente
+    ultimo_piso = _ultimo_registro(data_manager, 'pisos', -1)
+    if ultimo_piso is not None:
         norma = ultimo_piso['resol']
         desde = ultimo_piso['desde']
         hasta = ultimo_piso['hasta']
@@ -58,14 +67,11 @@ def mostrar_ultimos_datos(data_manager):
         else:
             periodo = f"{desde.strftime('%d/%m/%Y')} al {hasta.strftime('%d/%m/%Y')}"
         
-        piso_info = f"**PISO SRT** {norma} ({periodo}): $ {monto:,.2f}"
+        parts.append(f"**PISO SRT** {norma} ({periodo}): $ {monto:,.2f}")
     
-    # Mostrar alerta informativa
-    st.success(f"""
-    📊 **Últimos Datos Disponibles:**  
-    {ripte_info} | {ipc_info} | {tasa_info}  
-    {piso_info}
-    """)
+    # Mostrar alerta informativa solo con los datasets disponibles
+    if parts:
+        st.success("📊 **Últimos Datos Disponibles:**  \n" + " | ".join(parts))
 
 
 def mostrar_ultimos_datos_jus(data_manager):
@@ -75,21 +81,148 @@ def mostrar_ultimos_datos_jus(data_manager):
     Args:
         data_manager: Instancia de DataManager con el dataset JUS cargado
     """
+    parts = []
     
     # Obtener último JUS (primer registro ya que CSV está invertido)
-    jus_info = "N/A"
-    if hasattr(data_manager, 'jus_data') and not data_manager.jus_data.empty:
-        ultimo_jus = data_manager.jus_data.iloc[0]
+    ultimo_jus = _ultimo_registro(data_manager, 'jus')
+    if ultimo_jus is not None:
         fecha_jus = ultimo_jus['fecha']
         valor_jus = ultimo_jus['valor']
         acuerdo = ultimo_jus.get('acuerdo', 'N/A')
-        jus_info = f"**JUS** {fecha_jus.month}/{fecha_jus.year}: $ {valor_jus:,.2f} ({acuerdo})"
+        parts.append(f"**JUS** {fecha_jus.month}/{fecha_jus.year}: $ {valor_jus:,.2f} ({acuerdo})")
     
     # Mostrar alerta informativa
-    st.success(f"""
-    📊 **Últimos Datos Disponibles:**  
-    {jus_info}
-    """)
+    if parts:
+        st.success("📊 **Últimos Datos Disponibles:**  \n" + " | ".join(parts))
+
+
+class _DatasetsUltimos(NamedTuple):
+    """Datasets usados por mostrar_ultimos_datos_completo"""
+    ripte: pd.DataFrame
+    ipc: pd.DataFrame
+    tasa: pd.DataFrame
+    jus: pd.DataFrame
+    pisos: pd.DataFrame
+    ripte_valor_col: str
+
+
+# CSV del resumen de últimos datos: ripte, ipc, tasa, jus, pisos
+_DATA_FILES = (
+    "data/dataset_ripte.csv",
+    "data/dataset_ipc.csv",
+    "data/dataset_tasa.csv",
+    "data/Dataset_JUS.csv",
+    "data/dataset_pisos.csv",
+)
+
+
+def _mtimes() -> tuple:
+    """Fechas de modificación de _DATA_FILES, clave de _render_ultimos_html"""
+    return tuple(os.path.getmtime(p) for p in _DATA_FILES)
+
+
+def _load_all_datasets() -> _DatasetsUltimos:
+    """Carga los cinco datasets del resumen de últimos datos"""
+    f_ripte, f_ipc, f_tasa, f_jus, f_pisos = _DATA_FILES
+    df_ripte = pd.read_csv(f_ripte, encoding='utf-8')
+    # Formato explícito: evita la inferencia por elemento (cache_dates está activo por defecto)
+    df_ipc = pd.read_csv(f_ipc, encoding='utf-8',
+                         parse_dates=['periodo'], date_format='ISO8601')
+    df_tasa = pd.read_csv(f_tasa, encoding='utf-8',
+                          parse_dates=['Desde'], date_format='ISO8601')
+    # 'Hasta' mezcla 30/11/2025 y 2016-07-14: no se puede fijar un único formato
+    df_tasa['Hasta'] = pd.to_datetime(df_tasa['Hasta'], format='mixed', dayfirst=True, cache=True)
+    df_jus = pd.read_csv(f_jus, encoding='utf-8', converters={'VALOR IUS': parse_valor_ius})
+    df_pisos = pd.read_csv(f_pisos, encoding='utf-8')
+    # Columna de valor RIPTE según la versión del CSV (si no, la tercera columna)
+    ripte_valor_col = next(
+        (c for c in ('índice RIPTE', 'indice_ripte') if c in df_ripte.columns),
+        df_ripte.columns[2]
+    )
+    return _DatasetsUltimos(df_ripte, df_ipc, df_tasa, df_jus, df_pisos, ripte_valor_col)
+
+
+def _extraer_ripte(fila, datos: _DatasetsUltimos) -> dict:
+    """Mes/año y valor del último RIPTE (el mes viene en texto)"""
+    mes_texto = fila['mes']
+    # Mapear mes texto a número
+    mes = MESES_ES_INV.get(mes_texto.strip()[:3].lower(), mes_texto) if isinstance(mes_texto, str) else mes_texto
+    return {'mes': mes, 'año': fila['año'], 'valor': fila[datos.ripte_valor_col]}
+
+
+def _extraer_ipc(fila, datos: _DatasetsUltimos) -> dict:
+    """Período y variación mensual del último IPC"""
+    fecha = fila['periodo']
+    return {'mes': fecha.month, 'año': fecha.year, 'valor': fila['variacion_mensual']}
+
+
+def _extraer_tasa(fila, datos: _DatasetsUltimos) -> dict:
+    """Fecha hasta y valor de la última tasa activa"""
+    return {'fecha': fila['Hasta'].strftime("%d/%m/%Y"), 'valor': fila['Valor']}
+
+
+def _extraer_jus(fila, datos: _DatasetsUltimos) -> dict:
+    """Vigencia, acuerdo y valor del último JUS (ya parseado al leer el CSV)"""
+    fecha = fila['FECHA ENTRADA EN VIGENCIA ']
+    return {
+        'fecha': fecha.strip() if isinstance(fecha, str) else fecha,
+        # Simplificar acuerdo (solo número)
+        'acuerdo': fila['ACUERDO'].strip().replace('Acuerdo ', '').replace('acuerdo ', ''),
+        'valor': float(fila['VALOR IUS']),
+    }
+
+
+def _extraer_piso(fila, datos: _DatasetsUltimos) -> dict:
+    """Inicio, norma y monto del último piso SRT"""
+    return {'fecha': fila['fecha_inicio'], 'norma': fila['norma'], 'valor': float(fila['monto_minimo'])}
+
+
+# Ítems del resumen, en orden: (dataset, color, extractor, plantilla del texto)
+_SPECS = (
+    ('ripte', '#1f77b4', _extraer_ripte, 'RIPTE {mes}/{año}: {valor:,.0f}'),
+    ('ipc', '#2ca02c', _extraer_ipc, 'IPC {mes}/{año}: {valor:.2f}%'),
+    ('tasa', '#ff7f0e', _extraer_tasa, 'TASA {fecha}: {valor:.2f}%'),
+    ('jus', '#9467bd', _extraer_jus, 'JUS {fecha} - Ac.{acuerdo}: ${valor:,.2f}'),
+    ('pisos', '#d62728', _extraer_piso, 'PISO desde {fecha} - {norma}: ${valor:,.2f}'),
+)
+
+
+@st.cache_data(show_spinner=False)
+def _render_ultimos_html(mtimes: tuple) -> str:
+    """
+    Arma el bloque HTML de mostrar_ultimos_datos_completo.
+    
+    Cacheado por las fechas de modificación de los CSV: mientras no
+    cambien, cada rerun reutiliza el HTML sin leer ni formatear nada.
+    Un dataset vacío o con datos que no se pueden leer se omite.
+    Retorna "" si no hay datos para mostrar.
+    """
+    from utils.data_loader import get_ultimo_dato
+    
+    datos = _load_all_datasets()
+    
+    # Obtener últimos datos con colores
+    textos_datos = []
+    for campo, color, extraer, plantilla in _SPECS:
+        try:
+            fila = get_ultimo_dato(getattr(datos, campo))
+            if fila is None:
+                continue
+            texto = plantilla.format(**extraer(fila, datos))
+        except Exception:
+            continue
+        textos_datos.append(f'<span style="color: {color}; font-weight: 600;">{texto}</span>')
+    
+    if not textos_datos:
+        return ""
+    return f"""
+        <div style='background-color: #fffef0; padding: 1rem; border-radius: 8px; border-left: 4px solid #f0ad4e; margin-bottom: 1.5rem; margin-top: 2rem;'>
+            <p style='margin: 0; font-size: 0.95rem;'>
+                <strong style='color: #856404;'>📊 Últimos Datos Disponibles:</strong><br>
+                {' <span style="color: #ccc;">|</span> '.join(textos_datos)}
+            </p>
+        </div>
+    """
 
 
 def mostrar_ultimos_datos_completo():
@@ -98,112 +231,12 @@ def mostrar_ultimos_datos_completo():
     Versión completa usada en main.py con colores y formato detallado.
     """
     try:
-        from utils.data_loader import get_ultimo_dato
-        
-        # Cargar datasets
-        df_ripte = pd.read_csv("data/dataset_ripte.csv", encoding='utf-8')
-        
-        df_ipc = pd.read_csv("data/dataset_ipc.csv", encoding='utf-8')
-        df_ipc['periodo'] = pd.to_datetime(df_ipc['periodo'])
-        
-        df_tasa = pd.read_csv("data/dataset_tasa.csv", encoding='utf-8')
-        df_tasa['Desde'] = pd.to_datetime(df_tasa['Desde'])
-        df_tasa['Hasta'] = pd.to_datetime(df_tasa['Hasta'])
-        
-        df_jus = pd.read_csv("data/Dataset_JUS.csv", encoding='utf-8')
-        
-        df_pisos = pd.read_csv("data/dataset_pisos.csv", encoding='utf-8')
-        
-        # Obtener últimos datos con colores
-        textos_datos = []
-        
-        # RIPTE - Color azul
-        if not df_ripte.empty:
-            ultimo_ripte = get_ultimo_dato(df_ripte)
-            
-            # Usar directamente año y mes del dataframe
-            año_ripte = ultimo_ripte['año']
-            mes_texto = ultimo_ripte['mes']
-            
-            # Mapear mes texto a número
-            meses_map = {
-                'Enero': 1, 'Febrero': 2, 'Marzo': 3, 'Abril': 4,
-                'Mayo': 5, 'Junio': 6, 'Julio': 7, 'Agosto': 8,
-                'Septiembre': 9, 'Octubre': 10, 'Noviembre': 11, 'Diciembre': 12,
-                'Ene': 1, 'Feb': 2, 'Mar': 3, 'Abr': 4,
-                'May': 5, 'Jun': 6, 'Jul': 7, 'Ago': 8,
-                'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dic': 12
-            }
-            
-            mes_ripte = meses_map.get(mes_texto[:3], mes_texto) if isinstance(mes_texto, str) else mes_texto
-            
-            # Intentar diferentes nombres de columna para el valor
-            try:
-                valor_ripte = ultimo_ripte['índice RIPTE']
-            except:
-                try:
-                    valor_ripte = ultimo_ripte['indice_ripte']
-                except:
-                    valor_ripte = ultimo_ripte.iloc[2]  # Tercera columna
-            
-            textos_datos.append(f'<span style="color: #1f77b4; font-weight: 600;">RIPTE {mes_ripte}/{año_ripte}: {valor_ripte:,.0f}</span>')
-        
-        # IPC - Color verde
-        if not df_ipc.empty:
-            ultimo_ipc = get_ultimo_dato(df_ipc)
-            fecha_ipc = ultimo_ipc['periodo']
-            variacion_ipc = ultimo_ipc['variacion_mensual']
-            mes_ipc = fecha_ipc.month
-            año_ipc = fecha_ipc.year
-            textos_datos.append(f'<span style="color: #2ca02c; font-weight: 600;">IPC {mes_ipc}/{año_ipc}: {variacion_ipc:.2f}%</span>')
-        
-        # TASA - Color naranja
-        if not df_tasa.empty:
-            ultima_tasa = get_ultimo_dato(df_tasa)
-            valor_tasa = ultima_tasa['Valor']
-            fecha_hasta = ultima_tasa['Hasta']
-            fecha_txt = fecha_hasta.strftime("%d/%m/%Y")
-            textos_datos.append(f'<span style="color: #ff7f0e; font-weight: 600;">TASA {fecha_txt}: {valor_tasa:.2f}%</span>')
-        
-        # JUS - Color morado
-        try:
-            ultimo_jus = get_ultimo_dato(df_jus)
-            fecha_jus = ultimo_jus['FECHA ENTRADA EN VIGENCIA '].strip() if isinstance(ultimo_jus['FECHA ENTRADA EN VIGENCIA '], str) else ultimo_jus['FECHA ENTRADA EN VIGENCIA ']
-            valor_jus_str = ultimo_jus['VALOR IUS'].strip()
-            acuerdo_jus = ultimo_jus['ACUERDO'].strip()
-            
-            # Limpiar valor (quitar $ y espacios, convertir a float)
-            valor_jus = float(valor_jus_str.replace('$', '').replace('.', '').replace(',', '.').strip())
-            
-            # Simplificar acuerdo (solo número)
-            acuerdo_num = acuerdo_jus.replace('Acuerdo ', '').replace('acuerdo ', '')
-            
-            textos_datos.append(f'<span style="color: #9467bd; font-weight: 600;">JUS {fecha_jus} - Ac.{acuerdo_num}: ${valor_jus:,.2f}</span>')
-        except Exception as e_jus:
-            pass
-        
-        # PISOS - Color rojo
-        try:
-            ultimo_piso = get_ultimo_dato(df_pisos)
-            fecha_inicio = ultimo_piso['fecha_inicio']
-            norma_piso = ultimo_piso['norma']
-            monto_piso = float(ultimo_piso['monto_minimo'])
-            
-            textos_datos.append(f'<span style="color: #d62728; font-weight: 600;">PISO desde {fecha_inicio} - {norma_piso}: ${monto_piso:,.2f}</span>')
-        except Exception as e_piso:
-            pass
+        html = _render_ultimos_html(_mtimes())
         
         # Mostrar alerta solo si hay datos - con fondo crema suave
-        if textos_datos:
-            st.markdown(f"""
-                <div style='background-color: #fffef0; padding: 1rem; border-radius: 8px; border-left: 4px solid #f0ad4e; margin-bottom: 1.5rem; margin-top: 2rem;'>
-                    <p style='margin: 0; font-size: 0.95rem;'>
-                        <strong style='color: #856404;'>📊 Últimos Datos Disponibles:</strong><br>
-                        {' <span style="color: #ccc;">|</span> '.join(textos_datos)}
-                    </p>
-                </div>
-            """, unsafe_allow_html=True)
+        if html:
+            st.markdown(html, unsafe_allow_html=True)
     
     except Exception as e:
         # No mostrar error, simplemente omitir la alerta
-        pass
\ No newline at end of file
+        pass